@@ -40,6 +40,8 @@ export const JS_FILE_EXTENSION_PATTERN = /\.(ts|tsx|js|jsx)$/;
 // Repository analysis configuration
 export const MAX_REPO_SIZE_MB = 200; // Maximum repository size in MB
 export const CLONE_DEPTH = 1; // Git clone depth (1 = shallow clone, latest commit only)
+export const FILE_READ_BATCH_SIZE = 32; // Files read concurrently while compiling results
+export const ANALYSIS_CACHE_MAX_ENTRIES = 20000; // Per-analyzer cap on cached file results
 
 // Directories to exclude from analysis
 export const EXCLUDED_DIRS = [
@@ -0,0 +1,44 @@
+import { createHash } from "crypto";
+import { ANALYSIS_CACHE_MAX_ENTRIES } from "./constants";
+
+export interface ContentCache<T> {
+  // Return the cached result for this content, computing it on a miss
+  get(content: string, compute: (content: string) => T): T;
+}
+
+/**
+ * Create a bounded cache of per-file analysis results keyed by a hash of the
+ * file content. The server process is long-lived, so re-analyzing a repository
+ * (or files shared between repositories) skips work for unchanged files.
+ *
+ * @param maxEntries - Oldest entries are evicted once this size is reached
+ */
+export function createContentCache<T>(
+  maxEntries: number = ANALYSIS_CACHE_MAX_ENTRIES
+): ContentCache<T> {
+  const entries = new Map<string, T>();
+
+  return {
+    get(content: string, compute: (content: string) => T): T {
+      const key = createHash('sha256').update(content).digest('hex');
+
+      if (entries.has(key)) {
+        // Re-insert so the Map's insertion order tracks recency
+        const cached = entries.get(key)!;
+        entries.delete(key);
+        entries.set(key, cached);
+        return cached;
+      }
+
+      const result = compute(content);
+      if (entries.size >= maxEntries) {
+        const oldestKey = entries.keys().next().value;
+        if (oldestKey !== undefined) {
+          entries.delete(oldestKey);
+        }
+      }
+      entries.set(key, result);
+      return result;
+    },
+  };
+}
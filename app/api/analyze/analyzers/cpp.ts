@@ -1,6 +1,7 @@
 import * as path from "path";
 import * as fs from "fs";
 import { LanguageAnalyzer } from "./types";
+import { countOccurrences } from "./textScan";
 
 // Configuration toggles
 const INCLUDE_TESTS = true;
@@ -35,8 +36,8 @@ function calculateComplexity(content: string): number {
   complexity += (cleaned.match(/\bcase\s+/g) || []).length;
   complexity += (cleaned.match(/\bcatch\s*\(/g) || []).length;
   complexity += (cleaned.match(/\?[^:]*:/g) || []).length;
-  complexity += (cleaned.match(/&&/g) || []).length;
-  complexity += (cleaned.match(/\|\|/g) || []).length;
+  complexity += countOccurrences(cleaned, '&&');
+  complexity += countOccurrences(cleaned, '||');
 
   return complexity;
 }
@@ -1,6 +1,7 @@
 import * as path from "path";
 import * as fs from "fs";
 import { LanguageAnalyzer } from "./types";
+import { countOccurrences } from "./textScan";
 
 /**
  * Calculate cyclomatic complexity for C# code
@@ -27,8 +28,8 @@ export function calculateCSharpComplexity(content: string): number {
   complexity += (cleaned.match(/\bcase\s+/g) || []).length;
   complexity += (cleaned.match(/\bcatch\s*\(/g) || []).length;
   complexity += (cleaned.match(/\?[^:]*:/g) || []).length; // Ternary operators
-  complexity += (cleaned.match(/&&/g) || []).length;
-  complexity += (cleaned.match(/\|\|/g) || []).length;
+  complexity += countOccurrences(cleaned, '&&');
+  complexity += countOccurrences(cleaned, '||');
 
   return complexity;
 }
@@ -49,9 +50,11 @@ function extractNamespaceAndClass(content: string, filePath: string): { namespac
 }
 
 /**
- * Build a cache of all C# files with their namespaces
+ * Build a cache of all C# files with their namespaces, returning each
+ * readable file's content keyed by path
  */
-function buildCSharpNamespaceCache(allFiles: string[], baseDir: string): void {
+function buildCSharpNamespaceCache(allFiles: string[], baseDir: string): Map<string, string> {
+  const contents = new Map<string, string>();
   namespaceCache.clear(); // Clear existing cache
   
   console.log(`[C# Analyzer] Building namespace cache for ${allFiles.length} C# files...`);
@@ -60,6 +63,7 @@ function buildCSharpNamespaceCache(allFiles: string[], baseDir: string): void {
     try {
       const fullPath = path.join(baseDir, file);
       const content = fs.readFileSync(fullPath, 'utf-8');
+      contents.set(file, content);
       const { namespace, className } = extractNamespaceAndClass(content, file);
       namespaceCache.set(file, { namespace, className });
       
@@ -74,6 +78,8 @@ function buildCSharpNamespaceCache(allFiles: string[], baseDir: string): void {
   }
   
   console.log(`[C# Analyzer] Built cache with ${namespaceCache.size} files`);
+  
+  return contents;
 }
 
 /**
@@ -241,14 +247,14 @@ export const csharpAnalyzer: LanguageAnalyzer = {
     console.log(`[C# Analyzer] analyzeAll called with ${files.length} files`);
     
     // Build namespace cache first
-    buildCSharpNamespaceCache(files, repoPath);
+    const contents = buildCSharpNamespaceCache(files, repoPath);
     
     // Analyze each file
     for (const file of files) {
-      const fullPath = path.join(repoPath, file);
-      
       try {
-        const content = await fs.promises.readFile(fullPath, 'utf-8');
+        const content = contents.get(file);
+        if (content === undefined) continue;
+        contents.delete(file);
         const { usings, aliases } = extractUsings(content);
         
         const fileDeps = new Map<string, number>();
@@ -1,6 +1,7 @@
 import * as path from "path";
 import * as fs from "fs";
 import { LanguageAnalyzer } from "./types";
+import { countOccurrences } from "./textScan";
 
 /**
  * Calculate cyclomatic complexity for Go code
@@ -24,8 +25,8 @@ export function calculateGoComplexity(content: string): number {
   complexity += (cleaned.match(/\bswitch\b/g) || []).length;
   complexity += (cleaned.match(/\bcase\b/g) || []).length;
   complexity += (cleaned.match(/\bselect\b/g) || []).length; // Channel selection
-  complexity += (cleaned.match(/&&/g) || []).length;
-  complexity += (cleaned.match(/\|\|/g) || []).length;
+  complexity += countOccurrences(cleaned, '&&');
+  complexity += countOccurrences(cleaned, '||');
 
   return complexity;
 }
@@ -81,8 +82,10 @@ function extractPackageName(content: string): string {
 
 /**
  * Build cache of all Go packages with their symbols
+ * The returned map holds the source of every file that could be read
  */
-function buildGoPackageCache(allFiles: string[], baseDir: string): void {
+function buildGoPackageCache(allFiles: string[], baseDir: string): Map<string, string> {
+  const contents = new Map<string, string>();
   packageCache.clear();
   
   console.log(`[Go Analyzer] Building package cache for ${allFiles.length} Go files...`);
@@ -91,6 +94,7 @@ function buildGoPackageCache(allFiles: string[], baseDir: string): void {
     try {
       const fullPath = path.join(baseDir, file);
       const content = fs.readFileSync(fullPath, 'utf-8');
+      contents.set(file, content);
       const symbols = extractGoSymbols(content);
       const packageName = extractPackageName(content);
       
@@ -108,6 +112,8 @@ function buildGoPackageCache(allFiles: string[], baseDir: string): void {
   }
   
   console.log(`[Go Analyzer] Built cache with ${packageCache.size} files`);
+  
+  return contents;
 }
 
 /**
@@ -246,14 +252,14 @@ export const goAnalyzer: LanguageAnalyzer = {
     console.log(`[Go Analyzer] analyzeAll called with ${files.length} files`);
     
     // Build package cache first
-    buildGoPackageCache(files, repoPath);
+    const contents = buildGoPackageCache(files, repoPath);
     
     // Analyze each file
     for (const file of files) {
-      const fullPath = path.join(repoPath, file);
-      
       try {
-        const content = await fs.promises.readFile(fullPath, 'utf-8');
+        const content = contents.get(file);
+        if (content === undefined) continue;
+        contents.delete(file);
         const imports = extractImports(content);
         
         const fileDeps = new Map<string, number>();
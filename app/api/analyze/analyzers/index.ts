@@ -7,14 +7,16 @@ export { csharpAnalyzer } from "./csharp";
 export { goAnalyzer } from "./go";
 export { rustAnalyzer } from "./placeholders";
 
+import * as path from "path";
 import { LanguageAnalyzer } from "./types";
-import { jsAnalyzer } from "./javascript";
-import { pythonAnalyzer } from "./python";
+import { jsAnalyzer, calculateComplexity } from "./javascript";
+import { pythonAnalyzer, calculatePythonComplexity } from "./python";
 import { cppAnalyzer } from "./cpp";
-import { javaAnalyzer } from "./java";
-import { csharpAnalyzer } from "./csharp";
-import { goAnalyzer } from "./go";
+import { javaAnalyzer, calculateJavaComplexity } from "./java";
+import { csharpAnalyzer, calculateCSharpComplexity } from "./csharp";
+import { goAnalyzer, calculateGoComplexity } from "./go";
 import { rustAnalyzer } from "./placeholders";
+import { JS_EXTENSIONS, PYTHON_EXTENSIONS, JAVA_EXTENSIONS, CSHARP_EXTENSIONS, GO_EXTENSIONS } from "./constants";
 
 // Analyzer registry
 export const analyzers: LanguageAnalyzer[] = [
@@ -36,3 +38,26 @@ export function getAnalyzer(filePath: string): LanguageAnalyzer | null {
   }
   return null;
 }
+
+// Calculate cyclomatic complexity for a file based on its extension.
+// Returns null for languages without a complexity calculator, including Vue
+// single-file components, which esprima cannot parse.
+export function calculateFileComplexity(filePath: string, content: string): number | null {
+  const ext = path.extname(filePath).slice(1).toLowerCase();
+  const matches = (extensions: readonly string[]) => extensions.includes(ext);
+  
+  if (ext === 'vue') {
+    return null;
+  } else if (matches(JS_EXTENSIONS)) {
+    return calculateComplexity(content, filePath);
+  } else if (matches(PYTHON_EXTENSIONS)) {
+    return calculatePythonComplexity(content);
+  } else if (matches(JAVA_EXTENSIONS)) {
+    return calculateJavaComplexity(content);
+  } else if (matches(CSHARP_EXTENSIONS)) {
+    return calculateCSharpComplexity(content);
+  } else if (matches(GO_EXTENSIONS)) {
+    return calculateGoComplexity(content);
+  }
+  return null;
+}
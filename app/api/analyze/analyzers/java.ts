@@ -2,6 +2,8 @@ import * as path from "path";
 import * as fs from "fs";
 import { LanguageAnalyzer } from "./types";
 import { JAVA_EXTENSIONS } from "./constants";
+import { createContentCache } from "./contentCache";
+import { countOccurrences, LINE_TERMINATOR_PATTERN } from "./textScan";
 
 // Configuration toggles
 const INCLUDE_TESTS = true;
@@ -12,6 +14,157 @@ const importCounts = new Map<string, Map<string, number>>();
 // Store for complexity scores per file
 const complexityScores = new Map<string, number>();
 
+// Character codes used by the comment/literal scanner
+const CHAR_SLASH = 0x2f;        // '/'
+const CHAR_STAR = 0x2a;         // '*'
+const CHAR_BACKSLASH = 0x5c;    // '\\'
+const CHAR_DOUBLE_QUOTE = 0x22; // '"'
+const CHAR_SINGLE_QUOTE = 0x27; // "'"
+
+// Decision keywords, matched together in a single pass:
+// if/for/while/catch followed by '(', do followed by '{', and case labels
+const DECISION_KEYWORD_PATTERN = /\b(?:(?:if|for|while|catch)\s*\(|do\s*\{|case\s)/g;
+
+// Import statement pattern, matched against a single trimmed line
+const IMPORT_PATTERN = /^import\s+(?:static\s+)?([a-zA-Z_][\w.]*(?:\.\*)?)\s*;/;
+
+// Line prefixes that start a top-level type declaration. Annotations are not
+// included: in package-info.java they can precede the package declaration
+// and its imports, and an annotated type still reaches one of these lines.
+const TYPE_DECLARATION_PREFIXES = [
+  'public ', 'protected ', 'private ', 'abstract ', 'final ', 'sealed ', 'non-sealed ',
+  'strictfp ', 'static ', 'class ', 'interface ', 'enum ', 'record ',
+];
+
+/**
+ * Check for a line terminator, which a backslash inside a literal cannot
+ * escape (the literal is treated as unterminated instead)
+ */
+function isLineTerminator(code: number): boolean {
+  return code === 0x0a || code === 0x0d || code === 0x2028 || code === 0x2029;
+}
+
+/**
+ * Remove comments and string/char literals from Java code in a single
+ * left-to-right scan. indexOf jumps straight to the next '/', '"' or "'"
+ * (the only characters that can open a skipped region), plain code between
+ * them is copied in slices, and comment and literal bodies are skipped with
+ * indexOf or a tight charCode loop rather than regex backtracking.
+ *
+ * A literal or block comment that is never closed is left in place, as a
+ * regex replace would. When a literal scan fails at some position, every
+ * opener of the same kind before that position fails there too, so those
+ * scans are skipped to keep the pass linear.
+ */
+function stripCommentsAndLiterals(content: string): string {
+  const chunks: string[] = [];
+  const length = content.length;
+  let segmentStart = 0;
+  let index = 0;
+  
+  // Next position of each opener character (-1 once none remain)
+  let nextSlash = content.indexOf('/');
+  let nextDoubleQuote = content.indexOf('"');
+  let nextSingleQuote = content.indexOf("'");
+  
+  let stringFailsBefore = 0;
+  let charFailsBefore = 0;
+  let unterminatedBlockComment = false;
+  
+  while (true) {
+    if (nextSlash !== -1 && nextSlash < index) nextSlash = content.indexOf('/', index);
+    if (nextDoubleQuote !== -1 && nextDoubleQuote < index) nextDoubleQuote = content.indexOf('"', index);
+    if (nextSingleQuote !== -1 && nextSingleQuote < index) nextSingleQuote = content.indexOf("'", index);
+    
+    index = length;
+    if (nextSlash !== -1 && nextSlash < index) index = nextSlash;
+    if (nextDoubleQuote !== -1 && nextDoubleQuote < index) index = nextDoubleQuote;
+    if (nextSingleQuote !== -1 && nextSingleQuote < index) index = nextSingleQuote;
+    if (index === length) break;
+    
+    const code = content.charCodeAt(index);
+    let end = -1;
+    
+    if (code === CHAR_SLASH) {
+      const next = content.charCodeAt(index + 1);
+      if (next === CHAR_SLASH) {
+        // Single-line comment runs to the next line terminator (\n, \r,
+        // U+2028 or U+2029), matching what "//.*" used to strip
+        end = index + 2;
+        while (end < length && !isLineTerminator(content.charCodeAt(end))) end++;
+      } else if (next === CHAR_STAR && !unterminatedBlockComment) {
+        const close = content.indexOf('*/', index + 2);
+        if (close === -1) {
+          unterminatedBlockComment = true;
+        } else {
+          end = close + 2;
+        }
+      }
+    } else if (
+      (code === CHAR_DOUBLE_QUOTE && index >= stringFailsBefore) ||
+      (code === CHAR_SINGLE_QUOTE && index >= charFailsBefore)
+    ) {
+      let i = index + 1;
+      for (; i < length; i++) {
+        const literalCode = content.charCodeAt(i);
+        if (literalCode === code) {
+          end = i + 1;
+          break;
+        }
+        if (literalCode === CHAR_BACKSLASH) {
+          if (i + 1 >= length || isLineTerminator(content.charCodeAt(i + 1))) break;
+          i++; // Skip the escaped character
+        }
+      }
+      if (end === -1) {
+        if (code === CHAR_DOUBLE_QUOTE) {
+          stringFailsBefore = i;
+        } else {
+          charFailsBefore = i;
+        }
+      }
+    }
+    
+    if (end === -1) {
+      index++;
+      continue;
+    }
+    
+    chunks.push(content.slice(segmentStart, index));
+    segmentStart = index = end;
+  }
+  
+  chunks.push(content.slice(segmentStart));
+  return chunks.join('');
+}
+
+/**
+ * Count ternary operators in a single linear scan. A '?' directly after '<'
+ * or ',' (ignoring whitespace) is a generic wildcard, as in `List<?>` or
+ * `Map<K, ? extends V>`, and is not counted. Angle-bracket depth can't be
+ * used here because '<' and '>' are also comparison operators.
+ */
+function countTernaries(content: string): number {
+  let count = 0;
+  let index = content.indexOf('?');
+  
+  while (index !== -1) {
+    let previous = index - 1;
+    while (previous >= 0 && /\s/.test(content[previous])) {
+      previous--;
+    }
+    
+    const previousChar = previous >= 0 ? content[previous] : '';
+    if (previousChar !== '<' && previousChar !== ',') {
+      count++;
+    }
+    
+    index = content.indexOf('?', index + 1);
+  }
+  
+  return count;
+}
+
 /**
  * Calculate cyclomatic complexity for Java code using regex
  */
@@ -19,25 +172,13 @@ function calculateComplexity(content: string): number {
   let complexity = 1; // Base complexity
 
   // Remove comments and strings to avoid false positives
-  const cleaned = content
-    // Remove single-line comments
-    .replace(/\/\/.*?$/gm, '')
-    // Remove multi-line comments
-    .replace(/\/\*[\s\S]*?\*\//g, '')
-    // Remove strings
-    .replace(/"(?:[^"\\]|\\.)*"/g, '')
-    .replace(/'(?:[^'\\]|\\.)*'/g, '');
+  const cleaned = stripCommentsAndLiterals(content);
 
   // Count decision points
-  complexity += (cleaned.match(/\bif\s*\(/g) || []).length;
-  complexity += (cleaned.match(/\bfor\s*\(/g) || []).length;
-  complexity += (cleaned.match(/\bwhile\s*\(/g) || []).length;
-  complexity += (cleaned.match(/\bdo\s*\{/g) || []).length;
-  complexity += (cleaned.match(/\bcase\s+/g) || []).length;
-  complexity += (cleaned.match(/\bcatch\s*\(/g) || []).length;
-  complexity += (cleaned.match(/\?[^:]*:/g) || []).length;
-  complexity += (cleaned.match(/&&/g) || []).length;
-  complexity += (cleaned.match(/\|\|/g) || []).length;
+  complexity += (cleaned.match(DECISION_KEYWORD_PATTERN) || []).length;
+  complexity += countTernaries(cleaned);
+  complexity += countOccurrences(cleaned, '&&');
+  complexity += countOccurrences(cleaned, '||');
 
   return complexity;
 }
@@ -47,17 +188,76 @@ function calculateComplexity(content: string): number {
  */
 function extractImports(content: string): Map<string, number> {
   const imports = new Map<string, number>();
-  const importPattern = /^\s*import\s+(?:static\s+)?([a-zA-Z_][\w.]*(?:\.\*)?)\s*;/gm;
   
-  let match;
-  while ((match = importPattern.exec(content)) !== null) {
-    const importName = match[1];
-    imports.set(importName, (imports.get(importName) || 0) + 1);
+  let inBlockComment = false;
+  
+  for (const line of content.split(LINE_TERMINATOR_PATTERN)) {
+    // Drop comment text wherever it appears on the line, carrying block
+    // comment state across lines, so comments are never mistaken for a
+    // declaration and code sharing a line with a comment is still seen
+    let code = '';
+    let position = 0;
+    while (position < line.length) {
+      if (inBlockComment) {
+        const close = line.indexOf('*/', position);
+        if (close === -1) break;
+        inBlockComment = false;
+        position = close + 2;
+        continue;
+      }
+      
+      const open = line.indexOf('/*', position);
+      const lineComment = line.indexOf('//', position);
+      if (lineComment !== -1 && (open === -1 || lineComment < open)) {
+        code += line.slice(position, lineComment);
+        break;
+      }
+      if (open === -1) {
+        code += line.slice(position);
+        break;
+      }
+      code += line.slice(position, open) + ' ';
+      inBlockComment = true;
+      position = open + 2;
+    }
+    
+    const trimmed = code.trimStart();
+    
+    // Imports must precede the first type declaration, so stop scanning there
+    if (TYPE_DECLARATION_PREFIXES.some(prefix => trimmed.startsWith(prefix))) break;
+    
+    // Cheap prefix check so the regex only runs on candidate lines
+    if (!trimmed.startsWith('import')) continue;
+    
+    const match = IMPORT_PATTERN.exec(trimmed);
+    if (match) {
+      const importName = match[1];
+      imports.set(importName, (imports.get(importName) || 0) + 1);
+    }
   }
   
   return imports;
 }
 
+interface JavaFileAnalysis {
+  imports: Map<string, number>;
+  complexity: number;
+}
+
+// Results for previously seen file contents, shared across requests
+const analysisCache = createContentCache<JavaFileAnalysis>();
+
+/**
+ * Extract imports and complexity for Java code, reusing the cached result
+ * when the same content has been analyzed before
+ */
+function analyzeSource(content: string): JavaFileAnalysis {
+  return analysisCache.get(content, source => ({
+    imports: extractImports(source),
+    complexity: calculateComplexity(source),
+  }));
+}
+
 /**
  * Convert Java import path to file path.
  * Examples:
@@ -100,18 +300,12 @@ function javaImportToFilePath(importPath: string, allFiles: string[]): string |
 }
 
 /**
- * Calculate cyclomatic complexity for a Java file.
- * @param filePath - The full path to the Java file
+ * Calculate cyclomatic complexity for Java code.
+ * @param content - The Java source code, already read by the caller
  * @returns The cyclomatic complexity score
  */
-export function calculateJavaComplexity(filePath: string): number {
-  try {
-    const content = fs.readFileSync(filePath, 'utf-8');
-    return calculateComplexity(content);
-  } catch (error) {
-    console.error(`Failed to calculate complexity for ${filePath}:`, error);
-    return 1;
-  }
+export function calculateJavaComplexity(content: string): number {
+  return analyzeSource(content).complexity;
 }
 
 // Java analyzer
@@ -120,7 +314,7 @@ export const javaAnalyzer: LanguageAnalyzer = {
   
   analyze(filePath: string, content: string, allFiles: string[]): string[] {
     const dependencies: string[] = [];
-    const imports = extractImports(content);
+    const { imports } = analyzeSource(content);
     
     for (const [importPath] of imports.entries()) {
       const resolvedFile = javaImportToFilePath(importPath, allFiles);
@@ -150,8 +344,7 @@ export const javaAnalyzer: LanguageAnalyzer = {
       
       try {
         const content = fs.readFileSync(fullPath, 'utf-8');
-        const imports = extractImports(content);
-        const complexity = calculateComplexity(content);
+        const { imports, complexity } = analyzeSource(content);
         
         if (imports.size > 0) {
           importCounts.set(file, imports);
@@ -27,6 +27,22 @@ interface EsprimaModule {
 // eslint-disable-next-line @typescript-eslint/no-require-imports
 const esprima = require('esprima') as EsprimaModule;
 
+// Marks the end of a function's children on the AST traversal stack
+const FUNCTION_EXIT = Symbol('functionExit');
+
+// Node properties that never hold runtime code (locations, comments, parser
+// metadata and TypeScript type annotations). The complexity walk does not
+// descend into them, so type-heavy TS files don't pay for visiting types.
+const SKIPPED_AST_KEYS = new Set([
+  'loc', 'range', 'comments', 'leadingComments', 'trailingComments', 'innerComments', 'extra',
+  'typeAnnotation', 'typeParameters', 'typeArguments', 'superTypeParameters', 'returnType', 'implements',
+]);
+
+// Declarations that contain only types, skipped along with all their children
+const TYPE_ONLY_NODE_TYPES = new Set([
+  'TSInterfaceDeclaration', 'TSTypeAliasDeclaration', 'TSDeclareFunction', 'TSDeclareMethod',
+]);
+
 /**
  * Extract import specifiers and their counts directly from source code using Babel parser
  */
@@ -38,7 +54,9 @@ function extractImportsFromSource(filePath: string): Map<string, number> {
     const ast = babelParser.parse(source, {
       sourceType: 'module',
       plugins: ['typescript', 'jsx'],
-      errorRecovery: true
+      errorRecovery: true,
+      // Comments are never read, so skip attaching them to nodes
+      attachComment: false
     });
     
     for (const node of ast.program.body) {
@@ -163,7 +181,10 @@ export function calculateComplexity(content: string, filePath?: string): number
       try {
         const parsed = babelParser.parse(content, {
           sourceType: 'module',
-          plugins: ['typescript', 'jsx']
+          plugins: ['typescript', 'jsx'],
+          // Comments don't affect complexity; without them the walk below
+          // also skips the leading/trailing comment arrays on every node
+          attachComment: false
         });
         ast = parsed.program as unknown as EsprimaAST;
       } catch (parseError) {
@@ -173,12 +194,14 @@ export function calculateComplexity(content: string, filePath?: string): number
     } else {
       // Use esprima for JavaScript files
       try {
-        // Try parsing as ES6 module first (supports import/export)
-        ast = esprima.parseModule(content, { loc: true, jsx: true });
+        // Try parsing as ES6 module first (supports import/export).
+        // Location info is not requested: only the complexity total is
+        // reported, and skipping it avoids a loc object per node.
+        ast = esprima.parseModule(content, { jsx: true });
       } catch {
         try {
           // Fall back to script parsing (for non-module code)
-          ast = esprima.parseScript(content, { loc: true, jsx: true });
+          ast = esprima.parseScript(content, { jsx: true });
         } catch (parseError) {
           console.error(`Failed to parse ${filePath}:`, parseError);
           return 1;
@@ -194,17 +217,31 @@ export function calculateComplexity(content: string, filePath?: string): number
       { name: "global", complexity: 1, line: 0 }
     ];
     
-    function traverse(node: EsprimaNode | EsprimaAST | null | undefined): void {
-      if (!node || typeof node !== 'object') return;
+    // Walk the AST with an explicit stack instead of recursion, so deeply
+    // nested code cannot overflow the call stack. A FUNCTION_EXIT marker is
+    // pushed beneath a function's children and pops the function scope once
+    // all of them have been visited.
+    const stack: Array<EsprimaNode | EsprimaAST | typeof FUNCTION_EXIT> = [ast];
+    
+    while (stack.length > 0) {
+      const node = stack.pop()!;
+      
+      if (node === FUNCTION_EXIT) {
+        functionStack.pop();
+        continue;
+      }
       
       const n = node as EsprimaNode;
       
+      if (TYPE_ONLY_NODE_TYPES.has(n.type)) continue;
+      
       switch (n.type) {
         case "FunctionDeclaration":
           if (n.id) {
             const newFunction = { name: n.id.name, complexity: 1, line: n.loc?.start?.line || 0 };
             functionStack.push(newFunction);
             functionComplexities.push(newFunction);
+            stack.push(FUNCTION_EXIT);
           }
           break;
         case "FunctionExpression":
@@ -213,6 +250,7 @@ export function calculateComplexity(content: string, filePath?: string): number
           const newFunction = { name: functionName, complexity: 1, line: n.loc?.start?.line || 0 };
           functionStack.push(newFunction);
           functionComplexities.push(newFunction);
+          stack.push(FUNCTION_EXIT);
           break;
         case "IfStatement":
         case "ConditionalExpression":
@@ -238,27 +276,22 @@ export function calculateComplexity(content: string, filePath?: string): number
           break;
       }
       
-      // Traverse child nodes
+      // Queue child nodes
       for (const key in n) {
-        if (key === 'loc' || key === 'range' || key === 'comments') continue;
+        if (SKIPPED_AST_KEYS.has(key)) continue;
         const child = n[key];
         if (Array.isArray(child)) {
-          child.forEach(c => traverse(c as EsprimaNode));
+          for (const c of child) {
+            if (c && typeof c === 'object') {
+              stack.push(c as EsprimaNode);
+            }
+          }
         } else if (child && typeof child === 'object') {
-          traverse(child as EsprimaNode);
+          stack.push(child as EsprimaNode);
         }
       }
-      
-      // Pop function from stack when done
-      if (n.type === "FunctionDeclaration" || 
-          n.type === "FunctionExpression" || 
-          n.type === "ArrowFunctionExpression") {
-        functionStack.pop();
-      }
     }
     
-    traverse(ast);
-    
     // Sum up all function complexities to get total file complexity
     const totalComplexity = functionComplexities.reduce((sum, fn) => sum + fn.complexity, 0);
     
@@ -1,11 +1,46 @@
 import * as path from "path";
 import * as fs from "fs";
 import { LanguageAnalyzer } from "./types";
+import { createContentCache } from "./contentCache";
+import { LINE_TERMINATOR_PATTERN } from "./textScan";
+
+interface PythonImports {
+  imports: Set<string>;
+  fromImports: Map<string, Set<string>>;
+}
+
+interface PythonFileAnalysis extends PythonImports {
+  complexity: number;
+}
+
+// Results for previously seen file contents, shared across requests
+const analysisCache = createContentCache<PythonFileAnalysis>();
+
+// Decision keywords, matched together in a single pass over the source
+const DECISION_KEYWORD_PATTERN = /\b(?:if|elif|for|while|except|and|or|else)\b/g;
+
+// Import statement patterns, matched against a single trimmed logical line
+// Match: import module
+// Match: import module as alias
+const IMPORT_PATTERN = /^import\s+([\w.]+)(?:\s+as\s+\w+)?/;
+// Match: from module import symbol
+// Match: from module import symbol as alias
+// Match: from module import symbol1, symbol2
+// Match: from module import (symbol1, symbol2)
+const FROM_IMPORT_PATTERN = /^from\s+([\w.]+)\s+import\s+(.+)/;
+// Start of a from-import, required before continuation lines are joined
+const FROM_IMPORT_HEADER_PATTERN = /^from\s+[\w.]+\s+import\b/;
+// A continuation line of an import list: names, "as", commas, dots, parens
+const IMPORT_CONTINUATION_PATTERN = /^[\w\s,.()\\]*$/;
 
 /**
  * Calculate cyclomatic complexity for Python code
  */
 export function calculatePythonComplexity(content: string): number {
+  return analyzeSource(content).complexity;
+}
+
+function computeComplexity(content: string): number {
   let complexity = 1; // Base complexity
 
   // Remove comments and strings to avoid false positives
@@ -20,14 +55,7 @@ export function calculatePythonComplexity(content: string): number {
     .replace(/'(?:[^'\\]|\\.)*'/g, '');
 
   // Count decision points
-  complexity += (cleaned.match(/\bif\b/g) || []).length;
-  complexity += (cleaned.match(/\belif\b/g) || []).length;
-  complexity += (cleaned.match(/\bfor\b/g) || []).length;
-  complexity += (cleaned.match(/\bwhile\b/g) || []).length;
-  complexity += (cleaned.match(/\bexcept\b/g) || []).length;
-  complexity += (cleaned.match(/\band\b/g) || []).length;
-  complexity += (cleaned.match(/\bor\b/g) || []).length;
-  complexity += (cleaned.match(/\belse\b/g) || []).length;
+  complexity += (cleaned.match(DECISION_KEYWORD_PATTERN) || []).length;
 
   return complexity;
 }
@@ -61,8 +89,13 @@ function extractPythonSymbols(content: string): Set<string> {
 
 /**
  * Build cache of all Python modules with their symbols
+ * The source of each readable file is returned so analyzeAll does not read it
+ * from disk a second time. That keeps the whole repository's source in memory
+ * after the cache is built; analyzeAll releases each entry once its file has
+ * been analyzed (the Go and C# analyzers do the same).
  */
-function buildPythonModuleCache(allFiles: string[], baseDir: string): void {
+function buildPythonModuleCache(allFiles: string[], baseDir: string): Map<string, string> {
+  const contents = new Map<string, string>();
   moduleCache.clear();
   
   console.log(`[Python Analyzer] Building module cache for ${allFiles.length} Python files...`);
@@ -71,6 +104,7 @@ function buildPythonModuleCache(allFiles: string[], baseDir: string): void {
     try {
       const fullPath = path.join(baseDir, file);
       const content = fs.readFileSync(fullPath, 'utf-8');
+      contents.set(file, content);
       const symbols = extractPythonSymbols(content);
       
       // Convert file path to module path (e.g., src/models/user.py -> src.models.user)
@@ -91,6 +125,8 @@ function buildPythonModuleCache(allFiles: string[], baseDir: string): void {
   }
   
   console.log(`[Python Analyzer] Built cache with ${moduleCache.size} modules`);
+  
+  return contents;
 }
 
 /**
@@ -150,67 +186,100 @@ function pythonImportToFilePaths(importStatement: string, fromModule?: string, c
   return matches;
 }
 
+/**
+ * Extract imports and complexity for Python code in one analysis, so the
+ * complexity requested after analyzeAll is served from the same cache entry
+ */
+function analyzeSource(content: string): PythonFileAnalysis {
+  return analysisCache.get(content, source => ({
+    ...extractImports(source),
+    complexity: computeComplexity(source),
+  }));
+}
+
 /**
  * Extract import statements from Python content
  */
-function extractImports(content: string): {
-  imports: Set<string>;
-  fromImports: Map<string, Set<string>>;
-} {
+function extractImports(content: string): PythonImports {
   const imports = new Set<string>();
   const fromImports = new Map<string, Set<string>>();
+  const lines = content.split(LINE_TERMINATOR_PATTERN);
   
-  // Match: import module
-  // Match: import module as alias
-  const importRegex = /^\s*import\s+([\w.]+)(?:\s+as\s+\w+)?/gm;
-  
-  // Match: from module import symbol
-  // Match: from module import symbol as alias
-  // Match: from module import symbol1, symbol2
-  const fromImportRegex = /^\s*from\s+([\w.]+)\s+import\s+(.+)/gm;
-  
-  let match;
-  
-  // Extract regular imports
-  while ((match = importRegex.exec(content)) !== null) {
-    const moduleName = match[1];
+  for (let i = 0; i < lines.length; i++) {
+    const trimmed = lines[i].trimStart();
     
-    // Skip standard library and common third-party packages
-    if (isStandardLibrary(moduleName)) {
-      continue;
-    }
-    
-    imports.add(moduleName);
-  }
-  
-  // Extract from imports
-  while ((match = fromImportRegex.exec(content)) !== null) {
-    const moduleName = match[1];
-    const importList = match[2];
-    
-    // Skip standard library
-    if (isStandardLibrary(moduleName)) {
-      continue;
-    }
-    
-    // Parse imported symbols (handle "import a, b, c" and "import a as x, b as y")
-    const symbols = importList
-      .split(',')
-      .map(s => s.trim().split(' as ')[0].trim())
-      .filter(s => s);
-    
-    if (!fromImports.has(moduleName)) {
-      fromImports.set(moduleName, new Set());
-    }
-    
-    for (const symbol of symbols) {
-      fromImports.get(moduleName)!.add(symbol);
+    // Cheap prefix checks so the regexes only run on candidate lines
+    if (trimmed.startsWith('import')) {
+      const match = IMPORT_PATTERN.exec(trimmed);
+      if (!match) continue;
+      
+      const moduleName = match[1];
+      
+      // Skip standard library and common third-party packages
+      if (isStandardLibrary(moduleName)) {
+        continue;
+      }
+      
+      imports.add(moduleName);
+    } else if (trimmed.startsWith('from')) {
+      let statement = stripLineComment(trimmed);
+      
+      // Only real "from x import" statements may span lines; any other line
+      // starting with "from" (e.g. prose in a docstring) is left alone
+      const header = FROM_IMPORT_HEADER_PATTERN.exec(statement);
+      if (!header) continue;
+      const isParenthesized = statement.slice(header[0].length).trimStart().startsWith('(');
+      
+      // Join continuation lines for "from x import (a,\n b)" and trailing
+      // backslashes, stopping at the first line that can't be part of the list
+      while (
+        i + 1 < lines.length &&
+        (statement.endsWith('\\') || (isParenthesized && !statement.includes(')')))
+      ) {
+        const nextLine = stripLineComment(lines[i + 1]);
+        if (!IMPORT_CONTINUATION_PATTERN.test(nextLine)) break;
+        statement = statement.replace(/\\$/, '') + ' ' + nextLine;
+        i++;
+      }
+      
+      const match = FROM_IMPORT_PATTERN.exec(statement);
+      if (!match) continue;
+      
+      const moduleName = match[1];
+      const importList = match[2].replace(/[()]/g, '');
+      
+      // Skip standard library
+      if (isStandardLibrary(moduleName)) {
+        continue;
+      }
+      
+      // Parse imported symbols (handle "import a, b, c" and "import a as x, b as y")
+      const symbols = importList
+        .split(',')
+        .map(s => s.trim().split(' as ')[0].trim())
+        .filter(s => s);
+      
+      if (!fromImports.has(moduleName)) {
+        fromImports.set(moduleName, new Set());
+      }
+      
+      for (const symbol of symbols) {
+        fromImports.get(moduleName)!.add(symbol);
+      }
     }
   }
   
   return { imports, fromImports };
 }
 
+/**
+ * Remove a trailing "# ..." comment from a line of an import statement
+ */
+function stripLineComment(line: string): string {
+  const hashIndex = line.indexOf('#');
+  return (hashIndex === -1 ? line : line.slice(0, hashIndex)).trimEnd();
+}
+
 /**
  * Check if a module is from standard library or common third-party packages
  */
@@ -234,7 +303,7 @@ export const pythonAnalyzer: LanguageAnalyzer = {
     
     console.log(`[Python Analyzer] Analyzing file: ${filePath}`);
     
-    const { imports, fromImports } = extractImports(content);
+    const { imports, fromImports } = analyzeSource(content);
     
     console.log(`[Python Analyzer]   Imports: ${Array.from(imports).join(', ')}`);
     console.log(`[Python Analyzer]   From imports: ${Array.from(fromImports.keys()).join(', ')}`);
@@ -264,15 +333,16 @@ export const pythonAnalyzer: LanguageAnalyzer = {
     console.log(`[Python Analyzer] analyzeAll called with ${files.length} files`);
     
     // Build module cache first
-    buildPythonModuleCache(files, repoPath);
+    const contents = buildPythonModuleCache(files, repoPath);
     
     // Analyze each file
     for (const file of files) {
-      const fullPath = path.join(repoPath, file);
-      
       try {
-        const content = await fs.promises.readFile(fullPath, 'utf-8');
-        const { imports, fromImports } = extractImports(content);
+        // Take the source read while building the cache, releasing the entry
+        const content = contents.get(file);
+        if (content === undefined) continue;
+        contents.delete(file);
+        const { imports, fromImports } = analyzeSource(content);
         
         const fileDeps = new Map<string, number>();
         
@@ -296,15 +366,16 @@ export const pythonAnalyzer: LanguageAnalyzer = {
             } else {
               // Specific symbol - count usage in code
               const resolvedFiles = pythonImportToFilePaths(symbol, module, file);
+              if (resolvedFiles.length === 0) continue;
+              
+              // Count how many times this symbol is used once, then credit
+              // every file it resolves to with the same count
+              const symbolPattern = new RegExp(`\\b${symbol}\\b(?!\\()`, 'g');
+              const usageCount = (content.match(symbolPattern) || []).length;
+              if (usageCount === 0) continue;
               
               for (const dep of resolvedFiles) {
-                // Count how many times this symbol is used
-                const symbolPattern = new RegExp(`\\b${symbol}\\b(?!\\()`, 'g');
-                const matches = content.match(symbolPattern);
-                
-                if (matches && matches.length > 0) {
-                  fileDeps.set(dep, (fileDeps.get(dep) || 0) + matches.length);
-                }
+                fileDeps.set(dep, (fileDeps.get(dep) || 0) + usageCount);
               }
             }
           }
@@ -0,0 +1,25 @@
+/**
+ * Shared text scanning helpers for code analyzers
+ */
+
+/**
+ * Count non-overlapping occurrences of a literal substring.
+ * Uses indexOf rather than `match(/.../g).length`, so no array of matches
+ * is allocated just to read its length.
+ */
+export function countOccurrences(content: string, literal: string): number {
+  let count = 0;
+  let index = content.indexOf(literal);
+  while (index !== -1) {
+    count++;
+    index = content.indexOf(literal, index + literal.length);
+  }
+  return count;
+}
+
+/**
+ * Line terminators recognised by JavaScript's multiline `^` (CRLF, LF, CR,
+ * U+2028 and U+2029), for line-by-line scanners that replaced `/^.../gm`
+ * regexes. Splitting on '\n' alone would merge every line of a CR-only file.
+ */
+export const LINE_TERMINATOR_PATTERN = /\r\n|[\n\r\u2028\u2029]/;
@@ -1,16 +1,11 @@
 import { FileData } from "~/types/dsm";
-import { exec } from "child_process";
+import { exec, spawn } from "child_process";
 import { promisify } from "util";
 import * as fs from "fs/promises";
 import * as path from "path";
 import * as os from "os";
-import { getAnalyzer } from "./analyzers";
-import { calculateComplexity } from "./analyzers/javascript";
-import { calculatePythonComplexity } from "./analyzers/python";
-import { calculateJavaComplexity } from "./analyzers/java";
-import { calculateCSharpComplexity } from "./analyzers/csharp";
-import { calculateGoComplexity } from "./analyzers/go";
-import { CODE_EXTENSIONS, EXCLUDED_DIRS, MAX_REPO_SIZE_MB, CLONE_DEPTH } from "./analyzers/constants";
+import { getAnalyzer, calculateFileComplexity } from "./analyzers";
+import { CODE_EXTENSIONS, EXCLUDED_DIRS, MAX_REPO_SIZE_MB, CLONE_DEPTH, FILE_READ_BATCH_SIZE } from "./analyzers/constants";
 
 const execAsync = promisify(exec);
 
@@ -45,7 +40,7 @@ async function checkRepoSize(repoUrl: string): Promise<void> {
   } finally {
     // Clean up check directory
     try {
-      await execAsync(`rm -rf "${tmpCheckDir}"`);
+      await fs.rm(tmpCheckDir, { recursive: true, force: true });
     } catch (error) {
       console.error('Failed to clean up check directory:', error);
     }
@@ -72,7 +67,6 @@ async function cloneAndAnalyze(
   try {
     onProgress?.("Cloning repository... 0%");
     
-    const { spawn } = await import('child_process');
     await new Promise<void>((resolve, reject) => {
       const gitProcess = spawn('git', [
         'clone',
@@ -158,7 +152,7 @@ async function cloneAndAnalyze(
     return { files, tmpDir, branch };
   } catch (error) {
     try {
-      await execAsync(`rm -rf "${tmpDir}"`);
+      await fs.rm(tmpDir, { recursive: true, force: true });
     } catch (cleanupError) {
       console.error('Failed to clean up temp directory:', cleanupError);
     }
@@ -231,44 +225,35 @@ export async function analyzeGitRepoWithClone(
 
     const fileData: { [fileName: string]: FileData } = {};
 
-    for (const file of files) {
-      const fullPath = path.join(tmpDir, file);
-      let content = '';
-      let complexity = 1;
-      
-      try {
-        content = await fs.readFile(fullPath, 'utf-8');
-      } catch (error) {
-        console.error(`Failed to read file ${file}:`, error);
-      }
+    // Read files concurrently in batches; results are still assigned in
+    // file order so the fileData key order matches the sorted file list
+    for (let i = 0; i < files.length; i += FILE_READ_BATCH_SIZE) {
+      const batch = files.slice(i, i + FILE_READ_BATCH_SIZE);
+      const contents = await Promise.all(
+        batch.map(file =>
+          fs.readFile(path.join(tmpDir, file), 'utf-8').catch(error => {
+            console.error(`Failed to read file ${file}:`, error);
+            return '';
+          })
+        )
+      );
 
-      const _analyzer = fileAnalyzerMap.get(file);
-      
-      if (content) {
-        if (file.match(/\.(ts|tsx|js|jsx|vue)$/)) {
-          complexity = calculateComplexity(content, file);
-        } else if (file.endsWith('.py')) {
-          complexity = calculatePythonComplexity(content);
-        } else if (file.endsWith('.java')) {
-          complexity = calculateJavaComplexity(content);
-        } else if (file.endsWith('.cs')) {
-          complexity = calculateCSharpComplexity(content);
-        } else if (file.endsWith('.go')) {
-          complexity = calculateGoComplexity(content);
-        }
-      }
+      batch.forEach((file, batchIndex) => {
+        const content = contents[batchIndex];
+        const complexity = content ? calculateFileComplexity(file, content) ?? 1 : 1;
 
-      const depMap = allDependencies.get(file) || new Map<string, number>();
-      const dependencies = Array.from(depMap.entries()).map(([fileName, count]) => ({
-        fileName,
-        dependencies: count,
-      }));
+        const depMap = allDependencies.get(file) || new Map<string, number>();
+        const dependencies = Array.from(depMap.entries()).map(([fileName, count]) => ({
+          fileName,
+          dependencies: count,
+        }));
 
-      fileData[file] = {
-        complexity,
-        lineCount: content.split('\n').length,
-        dependencies,
-      };
+        fileData[file] = {
+          complexity,
+          lineCount: content.split('\n').length,
+          dependencies,
+        };
+      });
     }
 
     console.log('[Git Clone Analyzer] Analysis complete:', {
@@ -281,7 +266,7 @@ export async function analyzeGitRepoWithClone(
   } finally {
     if (tmpDir) {
       try {
-        await execAsync(`rm -rf "${tmpDir}"`);
+        await fs.rm(tmpDir, { recursive: true, force: true });
       } catch (error) {
         console.error('Failed to clean up temp directory:', error);
       }
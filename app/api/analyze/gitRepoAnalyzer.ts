@@ -2,12 +2,7 @@ import { FileData, FileDependency } from "~/types/dsm";
 import * as fs from "fs/promises";
 import * as path from "path";
 import * as os from "os";
-import { getAnalyzer } from "./analyzers";
-import { calculateComplexity } from "./analyzers/javascript";
-import { calculatePythonComplexity } from "./analyzers/python";
-import { calculateJavaComplexity } from "./analyzers/java";
-import { calculateCSharpComplexity } from "./analyzers/csharp";
-import { calculateGoComplexity } from "./analyzers/go";
+import { getAnalyzer, calculateFileComplexity } from "./analyzers";
 import { CODE_EXTENSIONS, EXCLUDED_DIRS } from "./analyzers/constants";
 
 export type ProgressCallback = (message: string) => void;
@@ -259,26 +254,7 @@ export async function analyzeGitRepo(
         const lineCount = content.split('\n').filter(line => line.trim().length > 0).length;
         
         // Calculate cyclomatic complexity
-        let complexity = 0;
-        const ext = path.extname(file).toLowerCase();
-        const jsExtensions = ['.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs'];
-        const pythonExtensions = ['.py'];
-        const javaExtensions = ['.java'];
-        const csharpExtensions = ['.cs'];
-        const goExtensions = ['.go'];
-        
-        if (jsExtensions.includes(ext)) {
-          complexity = calculateComplexity(content, file);
-        } else if (pythonExtensions.includes(ext)) {
-          complexity = calculatePythonComplexity(content);
-        } else if (javaExtensions.includes(ext)) {
-          const fullPath = path.join(tmpDir, file);
-          complexity = calculateJavaComplexity(fullPath);
-        } else if (csharpExtensions.includes(ext)) {
-          complexity = calculateCSharpComplexity(content);
-        } else if (goExtensions.includes(ext)) {
-          complexity = calculateGoComplexity(content);
-        }
+        const complexity = calculateFileComplexity(file, content) ?? 0;
         
         fileData[file] = {
           complexity,